@@ -13,13 +13,29 @@ from .schema import (
 )
 
 
+_TAG_BITS: Dict[str, int] = {}
+
+
+def _build_tag_mask(tags: List[str]) -> int:
+    mask = 0
+    for tag in tags:
+        bit = _TAG_BITS.get(tag)
+        if bit is None:
+            bit = _TAG_BITS[tag] = len(_TAG_BITS)
+        mask |= 1 << bit
+    return mask
+
+
 @dataclass
 class Product:
+    __slots__ = ('schema', '_tag_mask')
+    
     schema: ProductSchema
     
     def __post_init__(self):
         if not isinstance(self.schema, ProductSchema):
             raise ValueError("Invalid product schema provided")
+        self._tag_mask = _build_tag_mask(self.schema.metadata.tags)
     
     @property
     def product_id(self) -> str:
@@ -153,6 +169,9 @@ class Product:
     def tags(self) -> List[str]:
         return self.schema.metadata.tags.copy()
     
+    def count_common_tags(self, other: 'Product') -> int:
+        return bin(self._tag_mask & other._tag_mask).count("1")
+    
     def get_specification(self, key: str, default: Any = None) -> Any:
         return self.schema.specifications.get(key, default)
     
@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -150,6 +151,12 @@ class ConversationLogger:
         except Exception as e:
             raise ConversationLoggerError(f"Failed to load conversation from JSON: {str(e)}")
     
+    def get_log_directory_mtime_ns(self) -> int:
+        try:
+            return os.stat(self._log_directory).st_mtime_ns
+        except Exception as e:
+            raise ConversationLoggerError(f"Failed to stat log directory: {str(e)}")
+    
     def get_all_conversation_logs(self, extension: Optional[str] = None) -> list[Path]:
         try:
             if extension:
@@ -1,5 +1,6 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+from pathlib import Path
 import uuid
 from src.models.conversation.conversation import Conversation
 from src.models.user.user import User
@@ -26,6 +27,7 @@ class ConversationService:
         self._product_service = product_service or ProductService()
         self._logger = logger or ConversationLogger()
         self._active_conversations: Dict[str, Conversation] = {}
+        self._log_files_cache: Optional[Tuple[int, List[Path]]] = None
     
     def start_conversation(self, user: User) -> Conversation:
         try:
@@ -301,6 +303,18 @@ class ConversationService:
         except Exception as e:
             raise ConversationServiceError(f"Failed to abandon conversation: {str(e)}")
     
+    def get_log_files_cached(self) -> List[Path]:
+        try:
+            mtime_ns = self._logger.get_log_directory_mtime_ns()
+            
+            if self._log_files_cache is None or self._log_files_cache[0] != mtime_ns:
+                self._log_files_cache = (mtime_ns, self._logger.get_all_conversation_logs())
+            
+            return list(self._log_files_cache[1])
+            
+        except ConversationLoggerError as e:
+            raise ConversationServiceError(f"Failed to list conversation logs: {str(e)}")
+    
     def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
         return self._active_conversations.get(conversation_id)
     
@@ -12,6 +12,7 @@ class ProductRepository:
     def __init__(self, products_file_path: Optional[Path] = None):
         self._products_file = products_file_path or settings.paths.products_file
         self._products_cache: Optional[List[Product]] = None
+        self._version = 0
         self._validate_file_exists()
     
     def _validate_file_exists(self) -> None:
@@ -42,8 +43,13 @@ class ProductRepository:
     def get_all_products(self, force_reload: bool = False) -> List[Product]:
         if self._products_cache is None or force_reload:
             self._products_cache = self._load_products_from_file()
+            self._version += 1
         return self._products_cache.copy()
     
+    @property
+    def version(self) -> int:
+        return self._version
+    
     def get_product_by_id(self, product_id: str) -> Optional[Product]:
         products = self.get_all_products()
         for product in products:
@@ -1,19 +1,57 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, FrozenSet, Tuple
+from dataclasses import dataclass
 from decimal import Decimal
+from itertools import islice
 from src.models.product.product import Product
 from src.models.product.schema import PriceTier
 from src.models.user.user import User
 from .repository import ProductRepository
 
 
+# Indexed by int(rating * 2): 4.0-4.49 -> +2.0, 4.5 and above -> +4.0
+_RATING_BONUS = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 2.0, 4.0)
+_RATING_BONUS_MAX_INDEX = len(_RATING_BONUS) - 1
+
+
+@dataclass(frozen=True)
+class _UserScoringContext:
+    budget_min: Decimal
+    budget_max: Decimal
+    budget_sweet_spot: Decimal
+    categories_of_interest: FrozenSet[str]
+    key_features_valued: Tuple[str, ...]
+    
+    @classmethod
+    def from_user(cls, user: User) -> '_UserScoringContext':
+        return cls(
+            budget_min=user.budget_min,
+            budget_max=user.budget_max,
+            budget_sweet_spot=user.budget_sweet_spot,
+            categories_of_interest=frozenset(c.lower() for c in user.categories_of_interest),
+            key_features_valued=tuple(user.key_features_valued)
+        )
+
+
 class ProductService:
     
     def __init__(self, repository: Optional[ProductRepository] = None):
         self._repository = repository or ProductRepository()
+        self._product_count_cache: Optional[Tuple[int, int]] = None
     
     def get_all_products(self) -> List[Product]:
         return self._repository.get_all_products()
     
+    @property
+    def catalog_version(self) -> int:
+        return self._repository.version
+    
+    def get_product_count(self) -> int:
+        version = self._repository.version
+        if self._product_count_cache is None or self._product_count_cache[0] != version:
+            count = self._repository.get_product_count()
+            self._product_count_cache = (self._repository.version, count)
+        return self._product_count_cache[1]
+    
     def get_product_by_id(self, product_id: str) -> Optional[Product]:
         return self._repository.get_product_by_id(product_id)
     
@@ -28,57 +66,89 @@ class ProductService:
         tag: Optional[str] = None,
         available_only: bool = True
     ) -> List[Product]:
-        products = self._repository.get_all_products()
+        return list(self.iter_search_products(
+            category=category,
+            subcategory=subcategory,
+            brand=brand,
+            min_price=min_price,
+            max_price=max_price,
+            price_tier=price_tier,
+            tag=tag,
+            available_only=available_only
+        ))
+    
+    def iter_search_products(
+        self,
+        category: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        brand: Optional[str] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        price_tier: Optional[PriceTier] = None,
+        tag: Optional[str] = None,
+        available_only: bool = True
+    ) -> Iterator[Product]:
+        products: Iterable[Product] = self._repository.get_all_products()
         
         if available_only:
-            products = [p for p in products if p.is_available]
+            products = (p for p in products if p.is_available)
         
         if category:
-            products = [p for p in products if p.matches_category(category)]
+            products = (p for p in products if p.matches_category(category))
         
         if subcategory:
-            products = [p for p in products if p.matches_subcategory(subcategory)]
+            products = (p for p in products if p.matches_subcategory(subcategory))
         
         if brand:
-            products = [p for p in products if p.matches_brand(brand)]
+            products = (p for p in products if p.matches_brand(brand))
         
         if min_price is not None or max_price is not None:
-            products = [p for p in products if p.matches_price_range(min_price, max_price)]
+            products = (p for p in products if p.matches_price_range(min_price, max_price))
         
         if price_tier:
-            products = [p for p in products if p.matches_price_tier(price_tier)]
+            products = (p for p in products if p.matches_price_tier(price_tier))
         
         if tag:
-            products = [p for p in products if p.has_tag(tag)]
+            products = (p for p in products if p.has_tag(tag))
         
-        return products
+        return iter(products)
     
     def get_recommendations_for_user(self, user: User, limit: int = 5) -> List[Product]:
         products = self._repository.get_available_products()
+        context = _UserScoringContext.from_user(user)
         
         scored_products = []
         for product in products:
-            score = self._calculate_product_score_for_user(product, user)
-            scored_products.append((product, score))
+            score = self._calculate_product_score_for_user(product, user, context)
+            if score > 0:
+                scored_products.append((product, score))
         
         scored_products.sort(key=lambda x: x[1], reverse=True)
         
         return [product for product, score in scored_products[:limit]]
     
-    def _calculate_product_score_for_user(self, product: Product, user: User) -> float:
+    def _calculate_product_score_for_user(
+        self,
+        product: Product,
+        user: User,
+        context: Optional[_UserScoringContext] = None
+    ) -> float:
+        if context is None:
+            context = _UserScoringContext.from_user(user)
+        
         score = 0.0
         
-        if product.is_within_budget(user.budget_min, user.budget_max):
+        if product.is_within_budget(context.budget_min, context.budget_max):
             score += 10.0
-            if product.price <= user.budget_sweet_spot:
+            if product.price <= context.budget_sweet_spot:
                 score += 5.0
         else:
             return 0.0
         
-        if user.is_interested_in_category(product.category):
+        if product.category.lower() in context.categories_of_interest:
             score += 15.0
         
-        for feature in user.key_features_valued:
+        for feature in context.key_features_valued:
             if product.has_feature_keyword(feature):
                 score += 3.0
         
@@ -88,10 +158,8 @@ class ProductService:
         if product.is_on_sale:
             score += 3.0
         
-        if product.rating >= 4.5:
-            score += 4.0
-        elif product.rating >= 4.0:
-            score += 2.0
+        rating_index = min(max(int(product.rating * 2), 0), _RATING_BONUS_MAX_INDEX)
+        score += _RATING_BONUS[rating_index]
         
         return score
     
@@ -131,38 +199,39 @@ class ProductService:
         if product1.matches_price_tier(product2.price_tier):
             score += 3.0
         
-        common_tags = set(product1.tags) & set(product2.tags)
-        score += len(common_tags) * 2.0
+        score += product1.count_common_tags(product2) * 2.0
         
         return score
     
     def get_products_by_categories(self, categories: List[str], limit: Optional[int] = None) -> List[Product]:
-        products = []
-        for category in categories:
-            category_products = self._repository.get_products_by_category(category)
-            products.extend(category_products)
-        
-        products = [p for p in products if p.is_available]
-        
-        if limit:
-            return products[:limit]
-        return products
+        return list(self.iter_products_by_categories(categories, limit))
+    
+    def iter_products_by_categories(self, categories: List[str], limit: Optional[int] = None) -> Iterator[Product]:
+        products = (
+            p
+            for category in categories
+            for p in self._repository.get_products_by_category(category)
+        )
+        return self._iter_available(products, limit)
     
     def get_featured_products(self, limit: Optional[int] = None) -> List[Product]:
-        products = self._repository.get_featured_products()
-        products = [p for p in products if p.is_available]
-        
-        if limit:
-            return products[:limit]
-        return products
+        return list(self.iter_featured_products(limit))
+    
+    def iter_featured_products(self, limit: Optional[int] = None) -> Iterator[Product]:
+        return self._iter_available(self._repository.get_featured_products(), limit)
     
     def get_products_on_sale(self, limit: Optional[int] = None) -> List[Product]:
-        products = self._repository.get_products_on_sale()
-        products = [p for p in products if p.is_available]
-        
+        return list(self.iter_products_on_sale(limit))
+    
+    def iter_products_on_sale(self, limit: Optional[int] = None) -> Iterator[Product]:
+        return self._iter_available(self._repository.get_products_on_sale(), limit)
+    
+    @staticmethod
+    def _iter_available(products: Iterable[Product], limit: Optional[int] = None) -> Iterator[Product]:
+        available = (p for p in products if p.is_available)
         if limit:
-            return products[:limit]
-        return products
+            return islice(available, limit)
+        return available
     
     def get_product_summary_for_llm(self, product: Product) -> str:
         return (
@@ -173,15 +242,15 @@ class ProductService:
             f"Stock: {product.stock_status.value}."
         )
     
-    def get_products_summary_for_llm(self, products: List[Product]) -> str:
-        if not products:
-            return "No products available."
-        
+    def get_products_summary_for_llm(self, products: Iterable[Product]) -> str:
         summaries = []
         for i, product in enumerate(products, 1):
             summary = f"{i}. {self.get_product_summary_for_llm(product)}"
             summaries.append(summary)
         
+        if not summaries:
+            return "No products available."
+        
         return "\n".join(summaries)
     
     def get_available_categories(self) -> List[str]:
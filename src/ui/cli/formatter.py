@@ -1,6 +1,8 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime
+import os
 import re
+import sys
 import time
 from src.models.product.product import Product
 from src.models.user.user import User
@@ -8,19 +10,34 @@ from src.models.conversation.message import Message
 from src.config.settings import settings
 
 
+_ENUM_DISPLAY_CACHE: Dict[str, str] = {}
+
+
+def _pretty(value: str) -> str:
+    display = _ENUM_DISPLAY_CACHE.get(value)
+    if display is None:
+        display = _ENUM_DISPLAY_CACHE[value] = value.replace('_', ' ').title()
+    return display
+
+
 class CLIFormatter:
     
     BORDER_CHAR = "="
     SEPARATOR_CHAR = "-"
     BORDER_LENGTH = 80
+    _BORDER = BORDER_CHAR * BORDER_LENGTH
+    _ROLE_DISPLAY = {
+        "user": "👤 You",
+        "assistant": "SalesMate",
+        "system": "System"
+    }
+    _TIMESTAMP_FORMAT = settings.conversation.timestamp_format
+    _CLEAR_SEQUENCE = "\x1b[2J\x1b[H"
     
     @staticmethod
     def format_header(title: str) -> str:
-        border = CLIFormatter.BORDER_CHAR * CLIFormatter.BORDER_LENGTH
-        padding = (CLIFormatter.BORDER_LENGTH - len(title) - 2) // 2
-        centered_title = " " * padding + title + " " * padding
-        
-        return f"\n{border}\n{centered_title}\n{border}\n"
+        border = CLIFormatter._BORDER
+        return f"\n{border}\n{title.center(CLIFormatter.BORDER_LENGTH)}\n{border}\n"
     
     @staticmethod
     def format_section(title: str) -> str:
@@ -29,16 +46,11 @@ class CLIFormatter:
     
     @staticmethod
     def format_message(message: Message, show_timestamp: bool = True) -> str:
-        role_display = {
-            "user": "👤 You",
-            "assistant": "SalesMate",
-            "system": "System"
-        }
-        
-        role = role_display.get(message.role.value, message.role.value.capitalize())
+        role_value = message.role.value
+        role = CLIFormatter._ROLE_DISPLAY.get(role_value) or role_value.capitalize()
         
         if show_timestamp:
-            timestamp = message.get_formatted_timestamp(settings.conversation.timestamp_format)
+            timestamp = message.get_formatted_timestamp(CLIFormatter._TIMESTAMP_FORMAT)
             return f"[{timestamp}] {role}: {message.content}"
         else:
             return f"{role}: {message.content}"
@@ -70,6 +82,11 @@ class CLIFormatter:
         
         print("\n")
     
+    @staticmethod
+    def write_assistant_message(content: str) -> None:
+        sys.stdout.write(CLIFormatter.format_assistant_message(CLIFormatter.strip_markdown(content)) + "\n")
+        sys.stdout.flush()
+    
     @staticmethod
     def format_assistant_message(content: str) -> str:
         return f"\nSalesMate: {content}\n"
@@ -89,7 +106,7 @@ class CLIFormatter:
             summary += f" (Save {product.get_formatted_savings()} - {product.discount_percentage}% OFF!)"
         
         summary += f"\n  Rating: {product.rating}/5.0 ({product.review_count} reviews)"
-        summary += f"\n  Stock: {product.stock_status.value.replace('_', ' ').title()}"
+        summary += f"\n  Stock: {_pretty(product.stock_status.value)}"
         
         return summary
     
@@ -110,7 +127,7 @@ class CLIFormatter:
             details += f"\n  You Save: {product.get_formatted_savings()}"
         
         details += f"\n\nRating: {product.rating}/5.0 ({product.review_count} reviews)"
-        details += f"\nStock Status: {product.stock_status.value.replace('_', ' ').title()}"
+        details += f"\nStock Status: {_pretty(product.stock_status.value)}"
         
         details += f"\n\nDescription:\n{product.description}"
         
@@ -154,18 +171,18 @@ class CLIFormatter:
         
         profile += f"\nAge: {user.age} ({user.age_group.value})"
         profile += f"\nOccupation: {user.occupation}"
-        profile += f"\nTech Savviness: {user.tech_savviness.value.replace('_', ' ').title()}"
+        profile += f"\nTech Savviness: {_pretty(user.tech_savviness.value)}"
         
         profile += f"\n\nBudget Range: ${user.budget_min} - ${user.budget_max}"
         profile += f"\nPreferred Budget: ${user.budget_sweet_spot}"
         
         profile += f"\n\nInterests:"
         for interest in user.categories_of_interest[:5]:
-            profile += f"\n  • {interest.replace('_', ' ').title()}"
+            profile += f"\n  • {_pretty(interest)}"
         
         profile += f"\n\nValues:"
         for value in user.key_features_valued[:5]:
-            profile += f"\n  • {value.replace('_', ' ').title()}"
+            profile += f"\n  • {_pretty(value)}"
         
         return profile
     
@@ -193,7 +210,7 @@ class CLIFormatter:
         return result
     
     @staticmethod
-    def format_menu(title: str, options: List[str]) -> str:
+    def format_menu(title: str, options: Sequence[str]) -> str:
         menu = CLIFormatter.format_header(title)
         
         for i, option in enumerate(options, 1):
@@ -222,9 +239,19 @@ class CLIFormatter:
     
     @staticmethod
     def clear_screen() -> None:
-        import os
         os.system('cls' if os.name == 'nt' else 'clear')
     
+    @staticmethod
+    def render_screen(*parts: str) -> None:
+        if os.name == 'nt':
+            CLIFormatter.clear_screen()
+            prefix = ""
+        else:
+            prefix = CLIFormatter._CLEAR_SEQUENCE
+        
+        sys.stdout.write(prefix + "\n".join(parts) + "\n")
+        sys.stdout.flush()
+    
     @staticmethod
     def format_welcome_banner() -> str:
         app_name = settings.app.app_name
@@ -1,35 +1,151 @@
-from typing import Optional, List
+import os
+import shutil
+import sys
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
 from pathlib import Path
 from src.models.user.user import User
 from src.models.conversation.conversation import Conversation
 from src.models.product.product import Product
-from src.services.conversation.service import ConversationService, ConversationServiceError
-from src.services.product.service import ProductService
-from src.services.product.repository import ProductRepository
-from src.utils.file_handler.json_handler import JSONHandler
 from src.config.settings import settings
 from .menu import CLIMenu
 from .formatter import CLIFormatter
 from src.ui.prompts.user_prompts import UserPrompts
 
+if TYPE_CHECKING:
+    from src.services.conversation.service import ConversationService
+    from src.services.product.service import ProductService
+
+
+_PERSONA_CACHE: Dict[Tuple[str, float], List[User]] = {}
+
+_EXIT_TOKENS = frozenset({'exit', 'quit', 'end'})
+_CMD_DISPATCH = {'menu': '_handle_conversation_menu'}
+
 
 class CLIInterfaceError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    products: Tuple[Product, ...]
+    categories: Tuple[str, ...]
+    brands: Tuple[str, ...]
+    featured: Tuple[Product, ...]
+    on_sale: Tuple[Product, ...]
+    
+    @classmethod
+    def from_products(cls, products: List[Product]) -> 'CatalogSnapshot':
+        return cls(
+            products=tuple(products),
+            categories=tuple(sorted({p.category for p in products})),
+            brands=tuple(sorted({p.brand for p in products})),
+            featured=tuple(p for p in products if p.is_featured and p.is_available),
+            on_sale=tuple(p for p in products if p.is_on_sale and p.is_available)
+        )
+    
+    def available_in_category(self, category: str) -> List[Product]:
+        return [p for p in self.products if p.is_available and p.matches_category(category)]
+    
+    def available_by_brand(self, brand: str) -> List[Product]:
+        return [p for p in self.products if p.is_available and p.matches_brand(brand)]
+
+
 class CLIInterface:
     
     def __init__(self):
-        self._conversation_service = ConversationService()
-        self._product_service = ProductService()
+        self.__conversation_service: Optional[ConversationService] = None
+        self.__product_service: Optional[ProductService] = None
+        self.__personas: Optional[List[User]] = None
+        self.__catalog_snapshot: Optional[CatalogSnapshot] = None
+        self._catalog_version = -1
+        self._cat_cache: Dict[str, List[Product]] = {}
+        self._brand_cache: Dict[str, List[Product]] = {}
+        self._settings_validated = False
         self._current_conversation: Optional[Conversation] = None
         self._current_user: Optional[User] = None
-        self._personas: List[User] = []
+        self._rec_cache: Dict[Tuple[str, int], List[Product]] = {}
+        self._rendered_history: List[str] = []
+        self._last_rendered_idx = 0
+        self._cached_settings_render: Optional[str] = None
         self._running = True
+        
+        self._main_actions = (
+            None,
+            self._start_new_conversation,
+            self._view_product_catalog,
+            self._view_conversation_history,
+            self._view_settings,
+            self._exit_application
+        )
+        self._conversation_actions = (
+            None,
+            None,
+            self._get_product_recommendations,
+            self._view_product_details_in_conversation,
+            self._compare_products_in_conversation,
+            self._view_current_conversation_history,
+            self._confirm_and_end_conversation
+        )
+        self._catalog_actions = (
+            None,
+            self._view_all_products,
+            self._browse_by_category,
+            self._browse_by_brand,
+            self._view_featured_products,
+            self._view_products_on_sale,
+            self._search_products,
+            None
+        )
+        self._settings_actions = (
+            None,
+            self._display_current_settings,
+            self._toggle_conversation_logging,
+            self._change_log_format,
+            self._display_system_information,
+            None
+        )
+    
+    @property
+    def _conversation_service(self) -> 'ConversationService':
+        if self.__conversation_service is None:
+            from src.services.conversation.service import ConversationService
+            self._validate_settings()
+            self.__conversation_service = ConversationService()
+        return self.__conversation_service
+    
+    @property
+    def _product_service(self) -> 'ProductService':
+        if self.__product_service is None:
+            from src.services.product.service import ProductService
+            self._validate_settings()
+            self.__product_service = ProductService()
+        return self.__product_service
+    
+    @property
+    def _catalog_snapshot(self) -> CatalogSnapshot:
+        product_service = self._product_service
+        if self.__catalog_snapshot is None or product_service.catalog_version != self._catalog_version:
+            self._refresh_catalog_snapshot()
+            self.__catalog_snapshot = CatalogSnapshot.from_products(product_service.get_all_products())
+            self._catalog_version = product_service.catalog_version
+        return self.__catalog_snapshot
+    
+    def _refresh_catalog_snapshot(self) -> None:
+        self.__catalog_snapshot = None
+        self._cat_cache.clear()
+        self._brand_cache.clear()
+    
+    @property
+    def personas(self) -> List[User]:
+        if self.__personas is None:
+            self._validate_settings()
+            self.__personas = self._load_personas()
+        return self.__personas
     
     def start(self) -> None:
         try:
-            self._initialize()
             self._display_welcome()
             self._main_loop()
         except KeyboardInterrupt:
@@ -39,30 +155,48 @@ class CLIInterface:
             print(CLIFormatter.format_error(f"Fatal error: {str(e)}"))
             self._shutdown()
     
-    def _initialize(self) -> None:
+    def _validate_settings(self) -> None:
+        if self._settings_validated:
+            return
         try:
-            self._load_personas()
             settings.validate()
         except Exception as e:
             raise CLIInterfaceError(f"Initialization failed: {str(e)}")
+        self._settings_validated = True
     
-    def _load_personas(self) -> None:
+    def _load_personas(self) -> List[User]:
+        from src.utils.file_handler.json_handler import JSONHandler
+        
         try:
-            personas_data = JSONHandler.read_json(settings.paths.personas_file)
+            personas_file = settings.paths.personas_file
+            cache_key = (str(personas_file), os.path.getmtime(personas_file))
+            
+            cached = _PERSONA_CACHE.get(cache_key)
+            if cached is not None:
+                return list(cached)
+            
+            personas_data = JSONHandler.read_json(personas_file)
             personas_list = personas_data.get('personas', [])
             
-            self._personas = [User.from_dict(persona_data) for persona_data in personas_list]
+            personas = [User.from_dict(persona_data) for persona_data in personas_list]
             
-            if not self._personas:
+            if not personas:
                 raise CLIInterfaceError("No personas found in personas file")
+            
+            for stale_key in [key for key in _PERSONA_CACHE if key[0] == cache_key[0]]:
+                del _PERSONA_CACHE[stale_key]
+            _PERSONA_CACHE[cache_key] = personas
+            
+            return list(personas)
                 
         except Exception as e:
             raise CLIInterfaceError(f"Failed to load personas: {str(e)}")
     
     def _display_welcome(self) -> None:
-        CLIFormatter.clear_screen()
-        print(CLIFormatter.format_welcome_banner())
-        print(CLIFormatter.format_info("Welcome to your AI-powered sales assistant!"))
+        CLIFormatter.render_screen(
+            CLIFormatter.format_welcome_banner(),
+            CLIFormatter.format_info("Welcome to your AI-powered sales assistant!")
+        )
         UserPrompts.press_enter_to_continue()
     
     def _main_loop(self) -> None:
@@ -71,30 +205,27 @@ class CLIInterface:
                 CLIFormatter.clear_screen()
                 choice = CLIMenu.display_main_menu()
                 
-                if choice == 1:
-                    self._start_new_conversation()
-                elif choice == 2:
-                    self._view_product_catalog()
-                elif choice == 3:
-                    self._view_conversation_history()
-                elif choice == 4:
-                    self._view_settings()
-                elif choice == 5:
-                    self._exit_application()
+                action = self._main_actions[choice]
+                if action:
+                    action()
                     
             except Exception as e:
                 print(CLIFormatter.format_error(f"An error occurred: {str(e)}"))
                 UserPrompts.press_enter_to_continue()
     
     def _start_new_conversation(self) -> None:
+        from src.services.conversation.service import ConversationServiceError
+        
         CLIFormatter.clear_screen()
         
-        selected_user = CLIMenu.display_persona_selection_menu(self._personas)
+        selected_user = CLIMenu.display_persona_selection_menu(self.personas)
         
         if not selected_user:
             return
         
         self._current_user = selected_user
+        self._rec_cache.clear()
+        self._reset_rendered_history()
         
         try:
             self._current_conversation = self._conversation_service.start_conversation(selected_user)
@@ -116,18 +247,22 @@ class CLIInterface:
             UserPrompts.press_enter_to_continue()
     
     def _conversation_loop(self) -> None:
+        from src.services.conversation.service import ConversationServiceError
+        
         while self._current_conversation and self._current_conversation.is_active:
             try:
                 user_input = UserPrompts.get_conversation_message()
                 
-                if user_input.lower() in ['exit', 'quit', 'end']:
+                cmd = user_input.strip().casefold()
+                
+                if cmd in _EXIT_TOKENS:
                     if CLIMenu.confirm_end_conversation():
                         self._end_conversation()
                         break
                     continue
                 
-                if user_input.lower() == 'menu':
-                    self._handle_conversation_menu()
+                if cmd in _CMD_DISPATCH:
+                    getattr(self, _CMD_DISPATCH[cmd])()
                     continue
                 
                 print(CLIFormatter.format_info("Processing..."))
@@ -151,19 +286,13 @@ class CLIInterface:
         CLIFormatter.clear_screen()
         choice = CLIMenu.display_conversation_menu()
         
-        if choice == 1:
-            return
-        elif choice == 2:
-            self._get_product_recommendations()
-        elif choice == 3:
-            self._view_product_details_in_conversation()
-        elif choice == 4:
-            self._compare_products_in_conversation()
-        elif choice == 5:
-            self._view_current_conversation_history()
-        elif choice == 6:
-            if CLIMenu.confirm_end_conversation():
-                self._end_conversation()
+        action = self._conversation_actions[choice]
+        if action:
+            action()
+    
+    def _confirm_and_end_conversation(self) -> None:
+        if CLIMenu.confirm_end_conversation():
+            self._end_conversation()
     
     def _get_product_recommendations(self) -> None:
         try:
@@ -174,25 +303,32 @@ class CLIInterface:
                 self._current_user
             )
             
-            CLIFormatter.stream_assistant_message(response)
+            CLIFormatter.write_assistant_message(response)
             UserPrompts.press_enter_to_continue()
             
         except Exception as e:
             print(CLIFormatter.format_error(f"Failed to get recommendations: {str(e)}"))
             UserPrompts.press_enter_to_continue()
     
+    def _get_cached_recommendations(self, limit: int) -> List[Product]:
+        key = (self._current_user.persona_id, limit)
+        products = self._rec_cache.get(key)
+        if products is None:
+            products = self._product_service.get_recommendations_for_user(self._current_user, limit=limit)
+            self._rec_cache[key] = products
+        return products
+    
     def _view_product_details_in_conversation(self) -> None:
-        products = self._product_service.get_recommendations_for_user(self._current_user, limit=10)
+        products = self._get_cached_recommendations(limit=10)
         
         selected_product = CLIMenu.display_product_list_menu(products, "Available Products")
         
         if selected_product:
-            CLIFormatter.clear_screen()
-            print(CLIFormatter.format_product_detailed(selected_product))
+            CLIFormatter.render_screen(CLIFormatter.format_product_detailed(selected_product))
             UserPrompts.press_enter_to_continue()
     
     def _compare_products_in_conversation(self) -> None:
-        products = self._product_service.get_recommendations_for_user(self._current_user, limit=10)
+        products = self._get_cached_recommendations(limit=10)
         
         selected_products = CLIMenu.display_comparison_selection_menu(products)
         
@@ -210,8 +346,9 @@ class CLIInterface:
                 product_ids
             )
             
-            CLIFormatter.clear_screen()
-            CLIFormatter.stream_assistant_message(response)
+            CLIFormatter.render_screen(
+                CLIFormatter.format_assistant_message(CLIFormatter.strip_markdown(response))
+            )
             UserPrompts.press_enter_to_continue()
             
         except Exception as e:
@@ -222,16 +359,20 @@ class CLIInterface:
         if not self._current_conversation:
             return
         
-        CLIFormatter.clear_screen()
-        print(CLIFormatter.format_header("Conversation History"))
-        
         messages = self._current_conversation.get_all_messages()
-        for message in messages:
+        for message in messages[self._last_rendered_idx:]:
             if not message.is_system_message():
-                print(CLIFormatter.format_message(message))
+                self._rendered_history.append(CLIFormatter.format_message(message))
+        self._last_rendered_idx = len(messages)
+        
+        CLIFormatter.render_screen(CLIFormatter.format_header("Conversation History"), *self._rendered_history)
         
         UserPrompts.press_enter_to_continue()
     
+    def _reset_rendered_history(self) -> None:
+        self._rendered_history.clear()
+        self._last_rendered_idx = 0
+    
     def _end_conversation(self) -> None:
         if self._current_conversation:
             try:
@@ -239,12 +380,15 @@ class CLIInterface:
                 
                 summary = self._conversation_service.get_conversation_summary(self._current_conversation)
                 
-                CLIFormatter.clear_screen()
-                print(CLIFormatter.format_success("Conversation ended successfully"))
-                print(CLIFormatter.format_conversation_summary(summary))
+                CLIFormatter.render_screen(
+                    CLIFormatter.format_success("Conversation ended successfully"),
+                    CLIFormatter.format_conversation_summary(summary)
+                )
                 
                 self._current_conversation = None
                 self._current_user = None
+                self._rec_cache.clear()
+                self._reset_rendered_history()
                 
                 UserPrompts.press_enter_to_continue()
                 
@@ -257,47 +401,43 @@ class CLIInterface:
             CLIFormatter.clear_screen()
             choice = CLIMenu.display_product_catalog_menu()
             
-            if choice == 1:
-                self._view_all_products()
-            elif choice == 2:
-                self._browse_by_category()
-            elif choice == 3:
-                self._browse_by_brand()
-            elif choice == 4:
-                self._view_featured_products()
-            elif choice == 5:
-                self._view_products_on_sale()
-            elif choice == 6:
-                self._search_products()
-            elif choice == 7:
+            action = self._catalog_actions[choice]
+            if action is None:
                 break
+            action()
     
     def _view_all_products(self) -> None:
-        products = self._product_service.get_all_products()
+        products = list(self._catalog_snapshot.products)
         self._display_product_list(products, "All Products")
     
     def _browse_by_category(self) -> None:
-        categories = self._product_service.get_available_categories()
+        categories = list(self._catalog_snapshot.categories)
         selected_category = CLIMenu.display_category_selection_menu(categories)
         
         if selected_category:
-            products = self._product_service.search_products(category=selected_category)
+            products = self._cat_cache.get(selected_category)
+            if products is None:
+                products = self._catalog_snapshot.available_in_category(selected_category)
+                self._cat_cache[selected_category] = products
             self._display_product_list(products, f"Products in {selected_category.title()}")
     
     def _browse_by_brand(self) -> None:
-        brands = self._product_service.get_available_brands()
+        brands = list(self._catalog_snapshot.brands)
         selected_brand = CLIMenu.display_brand_selection_menu(brands)
         
         if selected_brand:
-            products = self._product_service.search_products(brand=selected_brand)
+            products = self._brand_cache.get(selected_brand)
+            if products is None:
+                products = self._catalog_snapshot.available_by_brand(selected_brand)
+                self._brand_cache[selected_brand] = products
             self._display_product_list(products, f"Products by {selected_brand}")
     
     def _view_featured_products(self) -> None:
-        products = self._product_service.get_featured_products()
+        products = list(self._catalog_snapshot.featured)
         self._display_product_list(products, "Featured Products")
     
     def _view_products_on_sale(self) -> None:
-        products = self._product_service.get_products_on_sale()
+        products = list(self._catalog_snapshot.on_sale)
         self._display_product_list(products, "Products on Sale")
     
     def _search_products(self) -> None:
@@ -314,32 +454,30 @@ class CLIInterface:
             self._display_product_details(selected_product)
     
     def _display_product_details(self, product: Product) -> None:
-        CLIFormatter.clear_screen()
-        print(CLIFormatter.format_product_detailed(product))
+        CLIFormatter.render_screen(CLIFormatter.format_product_detailed(product))
         UserPrompts.press_enter_to_continue()
     
     def _view_conversation_history(self) -> None:
-        log_files = self._conversation_service._logger.get_all_conversation_logs()
+        log_files = self._conversation_service.get_log_files_cached()
         
         if not log_files:
             print(CLIFormatter.format_info("No conversation history found"))
             UserPrompts.press_enter_to_continue()
             return
         
-        file_names = [f.name for f in log_files]
-        
-        selected_index = CLIMenu.display_conversation_history_menu(file_names)
+        selected_index = CLIMenu.display_conversation_history_menu(log_files)
         
         if selected_index is not None:
             self._display_conversation_log(log_files[selected_index])
     
     def _display_conversation_log(self, log_file: Path) -> None:
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(log_file, 'r', encoding='utf-8', buffering=65536) as f:
+                CLIFormatter.clear_screen()
+                shutil.copyfileobj(f, sys.stdout)
             
-            CLIFormatter.clear_screen()
-            print(content)
+            sys.stdout.write("\n")
+            sys.stdout.flush()
             UserPrompts.press_enter_to_continue()
             
         except Exception as e:
@@ -351,28 +489,25 @@ class CLIInterface:
             CLIFormatter.clear_screen()
             choice = CLIMenu.display_settings_menu()
             
-            if choice == 1:
-                self._display_current_settings()
-            elif choice == 2:
-                self._toggle_conversation_logging()
-            elif choice == 3:
-                self._change_log_format()
-            elif choice == 4:
-                self._display_system_information()
-            elif choice == 5:
+            action = self._settings_actions[choice]
+            if action is None:
                 break
+            action()
     
     def _display_current_settings(self) -> None:
-        CLIFormatter.clear_screen()
-        print(CLIFormatter.format_header("Current Settings"))
-        
-        config = settings.get_config_dict()
-        
-        for section, values in config.items():
-            print(f"\n{section.upper()}:")
-            for key, value in values.items():
-                print(f"  {key}: {value}")
+        if self._cached_settings_render is None:
+            lines = [CLIFormatter.format_header("Current Settings")]
+            
+            config = settings.get_config_dict()
+            
+            for section, values in config.items():
+                lines.append(f"\n{section.upper()}:")
+                for key, value in values.items():
+                    lines.append(f"  {key}: {value}")
+            
+            self._cached_settings_render = "\n".join(lines)
         
+        CLIFormatter.render_screen(self._cached_settings_render)
         UserPrompts.press_enter_to_continue()
     
     def _toggle_conversation_logging(self) -> None:
@@ -387,19 +522,19 @@ class CLIInterface:
         UserPrompts.press_enter_to_continue()
     
     def _display_system_information(self) -> None:
-        CLIFormatter.clear_screen()
-        print(CLIFormatter.format_header("System Information"))
-        
-        print(f"\nApplication: {settings.app.app_name}")
-        print(f"Version: {settings.app.version}")
-        print(f"Environment: {settings.app.environment}")
-        print(f"Debug Mode: {settings.app.debug}")
+        product_count = self._product_service.get_product_count()
         
-        print(f"\nLLM Model: {settings.openai.model}")
-        print(f"Temperature: {settings.openai.temperature}")
-        
-        print(f"\nTotal Products: {self._product_service._repository.get_product_count()}")
-        print(f"Total Personas: {len(self._personas)}")
+        CLIFormatter.render_screen(
+            CLIFormatter.format_header("System Information"),
+            f"\nApplication: {settings.app.app_name}",
+            f"Version: {settings.app.version}",
+            f"Environment: {settings.app.environment}",
+            f"Debug Mode: {settings.app.debug}",
+            f"\nLLM Model: {settings.openai.model}",
+            f"Temperature: {settings.openai.temperature}",
+            f"\nTotal Products: {product_count}",
+            f"Total Personas: {len(self.personas)}"
+        )
         
         UserPrompts.press_enter_to_continue()
     
@@ -413,6 +548,5 @@ class CLIInterface:
             if UserPrompts.get_yes_no_input("Save conversation before exiting?", default=True):
                 self._end_conversation()
         
-        CLIFormatter.clear_screen()
-        print(CLIFormatter.format_goodbye_message())
+        CLIFormatter.render_screen(CLIFormatter.format_goodbye_message())
         self._running = False
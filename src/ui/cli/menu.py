@@ -1,10 +1,66 @@
-from typing import List, Optional, Callable
+import sys
+from typing import List, Optional, Callable, Set
+from pathlib import Path
 from src.models.user.user import User
 from src.models.product.product import Product
 from .formatter import CLIFormatter
 from src.ui.prompts.user_prompts import UserPrompts
 
 
+_MAIN_MENU_OPTIONS = (
+    "Start New Conversation",
+    "View Product Catalog",
+    "View Conversation History",
+    "Settings",
+    "Exit"
+)
+_MAIN_MENU_STR = CLIFormatter.format_menu("Main Menu", _MAIN_MENU_OPTIONS)
+_MAIN_MENU_COUNT = len(_MAIN_MENU_OPTIONS)
+
+_CONV_MENU_OPTIONS = (
+    "Continue Conversation",
+    "Get Product Recommendations",
+    "View Product Details",
+    "Compare Products",
+    "View Conversation History",
+    "End Conversation"
+)
+_CONV_MENU_STR = CLIFormatter.format_menu("Conversation Menu", _CONV_MENU_OPTIONS)
+_CONV_MENU_COUNT = len(_CONV_MENU_OPTIONS)
+
+_CATALOG_MENU_OPTIONS = (
+    "View All Products",
+    "Browse by Category",
+    "Browse by Brand",
+    "View Featured Products",
+    "View Products on Sale",
+    "Search Products",
+    "Back to Main Menu"
+)
+_CATALOG_MENU_STR = CLIFormatter.format_menu("Product Catalog", _CATALOG_MENU_OPTIONS)
+_CATALOG_MENU_COUNT = len(_CATALOG_MENU_OPTIONS)
+
+_SETTINGS_MENU_OPTIONS = (
+    "View Current Settings",
+    "Toggle Conversation Logging",
+    "Change Log Format",
+    "View System Information",
+    "Back to Main Menu"
+)
+_SETTINGS_MENU_STR = CLIFormatter.format_menu("Settings", _SETTINGS_MENU_OPTIONS)
+_SETTINGS_MENU_COUNT = len(_SETTINGS_MENU_OPTIONS)
+
+_PRODUCT_DETAILS_OPTIONS = (
+    "View Similar Products",
+    "Add to Conversation Context",
+    "Back"
+)
+_PRODUCT_DETAILS_OPTIONS_STR = "\n".join(
+    f"{i}. {option}" for i, option in enumerate(_PRODUCT_DETAILS_OPTIONS, 1)
+)
+_PRODUCT_DETAILS_MENU_COUNT = len(_PRODUCT_DETAILS_OPTIONS)
+
+
 class MenuOption:
     
     def __init__(self, label: str, action: Callable, description: Optional[str] = None):
@@ -37,16 +93,8 @@ class CLIMenu:
     
     @staticmethod
     def display_main_menu() -> int:
-        options = [
-            "Start New Conversation",
-            "View Product Catalog",
-            "View Conversation History",
-            "Settings",
-            "Exit"
-        ]
-        
-        print(CLIFormatter.format_menu("Main Menu", options))
-        return UserPrompts.get_menu_choice("Select an option", len(options))
+        print(_MAIN_MENU_STR)
+        return UserPrompts.get_menu_choice("Select an option", _MAIN_MENU_COUNT)
     
     @staticmethod
     def display_persona_selection_menu(personas: List[User]) -> Optional[User]:
@@ -54,15 +102,16 @@ class CLIMenu:
             print(CLIFormatter.format_error("No personas available"))
             return None
         
-        print(CLIFormatter.format_header("Select Customer Persona"))
+        lines = [CLIFormatter.format_header("Select Customer Persona")]
         
         for i, persona in enumerate(personas, 1):
-            print(f"\n{i}. {persona.name}")
-            print(f"   Age: {persona.age} | Occupation: {persona.occupation}")
-            print(f"   Tech Level: {persona.tech_savviness.value}")
-            print(f"   Budget: ${persona.budget_min} - ${persona.budget_max}")
+            lines.append(f"\n{i}. {persona.name}")
+            lines.append(f"   Age: {persona.age} | Occupation: {persona.occupation}")
+            lines.append(f"   Tech Level: {persona.tech_savviness.value}")
+            lines.append(f"   Budget: ${persona.budget_min} - ${persona.budget_max}")
         
-        print(f"\n0. Cancel")
+        lines.append("\n0. Cancel")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         choice = UserPrompts.get_menu_choice("Select a persona", len(personas), allow_back=True)
         
@@ -73,32 +122,13 @@ class CLIMenu:
     
     @staticmethod
     def display_conversation_menu() -> int:
-        options = [
-            "Continue Conversation",
-            "Get Product Recommendations",
-            "View Product Details",
-            "Compare Products",
-            "View Conversation History",
-            "End Conversation"
-        ]
-        
-        print(CLIFormatter.format_menu("Conversation Menu", options))
-        return UserPrompts.get_menu_choice("Select an option", len(options))
+        print(_CONV_MENU_STR)
+        return UserPrompts.get_menu_choice("Select an option", _CONV_MENU_COUNT)
     
     @staticmethod
     def display_product_catalog_menu() -> int:
-        options = [
-            "View All Products",
-            "Browse by Category",
-            "Browse by Brand",
-            "View Featured Products",
-            "View Products on Sale",
-            "Search Products",
-            "Back to Main Menu"
-        ]
-        
-        print(CLIFormatter.format_menu("Product Catalog", options))
-        return UserPrompts.get_menu_choice("Select an option", len(options))
+        print(_CATALOG_MENU_STR)
+        return UserPrompts.get_menu_choice("Select an option", _CATALOG_MENU_COUNT)
     
     @staticmethod
     def display_product_list_menu(products: List[Product], title: str = "Products") -> Optional[Product]:
@@ -120,19 +150,11 @@ class CLIMenu:
     
     @staticmethod
     def display_product_details_menu(product: Product) -> int:
-        print(CLIFormatter.format_product_detailed(product))
-        
-        options = [
-            "View Similar Products",
-            "Add to Conversation Context",
-            "Back"
-        ]
+        sys.stdout.write(
+            f"{CLIFormatter.format_product_detailed(product)}\n\n\n{_PRODUCT_DETAILS_OPTIONS_STR}\n"
+        )
         
-        print("\n")
-        for i, option in enumerate(options, 1):
-            print(f"{i}. {option}")
-        
-        return UserPrompts.get_menu_choice("Select an option", len(options))
+        return UserPrompts.get_menu_choice("Select an option", _PRODUCT_DETAILS_MENU_COUNT)
     
     @staticmethod
     def display_category_selection_menu(categories: List[str]) -> Optional[str]:
@@ -140,12 +162,13 @@ class CLIMenu:
             print(CLIFormatter.format_error("No categories available"))
             return None
         
-        print(CLIFormatter.format_header("Select Category"))
+        lines = [CLIFormatter.format_header("Select Category")]
         
         for i, category in enumerate(categories, 1):
-            print(f"{i}. {category.replace('_', ' ').title()}")
+            lines.append(f"{i}. {category.replace('_', ' ').title()}")
         
-        print("0. Cancel")
+        lines.append("0. Cancel")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         choice = UserPrompts.get_menu_choice("Select a category", len(categories), allow_back=True)
         
@@ -160,12 +183,13 @@ class CLIMenu:
             print(CLIFormatter.format_error("No brands available"))
             return None
         
-        print(CLIFormatter.format_header("Select Brand"))
+        lines = [CLIFormatter.format_header("Select Brand")]
         
         for i, brand in enumerate(brands, 1):
-            print(f"{i}. {brand}")
+            lines.append(f"{i}. {brand}")
         
-        print("0. Cancel")
+        lines.append("0. Cancel")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         choice = UserPrompts.get_menu_choice("Select a brand", len(brands), allow_back=True)
         
@@ -176,31 +200,24 @@ class CLIMenu:
     
     @staticmethod
     def display_settings_menu() -> int:
-        options = [
-            "View Current Settings",
-            "Toggle Conversation Logging",
-            "Change Log Format",
-            "View System Information",
-            "Back to Main Menu"
-        ]
-        
-        print(CLIFormatter.format_menu("Settings", options))
-        return UserPrompts.get_menu_choice("Select an option", len(options))
+        print(_SETTINGS_MENU_STR)
+        return UserPrompts.get_menu_choice("Select an option", _SETTINGS_MENU_COUNT)
     
     @staticmethod
-    def display_conversation_history_menu(conversation_files: List[str]) -> Optional[int]:
-        if not conversation_files:
+    def display_conversation_history_menu(log_files: List[Path]) -> Optional[int]:
+        if not log_files:
             print(CLIFormatter.format_info("No conversation history found"))
             return None
         
-        print(CLIFormatter.format_header("Conversation History"))
+        lines = [CLIFormatter.format_header("Conversation History")]
         
-        for i, filename in enumerate(conversation_files, 1):
-            print(f"{i}. {filename}")
+        for i, log_file in enumerate(log_files, 1):
+            lines.append(f"{i}. {log_file.name}")
         
-        print("0. Back")
+        lines.append("0. Back")
+        sys.stdout.write("\n".join(lines) + "\n")
         
-        choice = UserPrompts.get_menu_choice("Select a conversation to view", len(conversation_files), allow_back=True)
+        choice = UserPrompts.get_menu_choice("Select a conversation to view", len(log_files), allow_back=True)
         
         if choice == 0:
             return None
@@ -215,9 +232,11 @@ class CLIMenu:
         
         print(CLIFormatter.format_header("Select Products to Compare"))
         print(CLIFormatter.format_info("You can select 2-4 products for comparison"))
-        print(CLIFormatter.format_product_list(products, numbered=True))
+        product_list_str = CLIFormatter.format_product_list(products, numbered=True)
+        print(product_list_str)
         
         selected_products = []
+        selected_ids: Set[str] = set()
         
         while len(selected_products) < 4:
             if selected_products:
@@ -233,10 +252,11 @@ class CLIMenu:
             
             selected_product = products[choice - 1]
             
-            if selected_product in selected_products:
+            if selected_product.product_id in selected_ids:
                 print(CLIFormatter.format_warning("Product already selected"))
                 continue
             
+            selected_ids.add(selected_product.product_id)
             selected_products.append(selected_product)
             
             if len(selected_products) >= 2:
@@ -1,13 +1,36 @@
+import sys
 from typing import Optional, List
 from src.utils.validators.input_validator import InputValidator
 
 
+_RANGE_FMT = {
+    (True, True): lambda lo, hi: f" ({lo} - {hi})",
+    (True, False): lambda lo, hi: f" (minimum: {lo})",
+    (False, True): lambda lo, hi: f" (maximum: {hi})",
+    (False, False): lambda lo, hi: "",
+}
+
+
+def _prompt(message: str) -> str:
+    if sys.stdin.isatty():
+        return input(message)
+    
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line.rstrip('\n')
+
+
 class UserPrompts:
     
     @staticmethod
     def get_user_input(prompt: str, allow_empty: bool = False) -> str:
+        full_prompt = f"\n{prompt}\n> "
+        
         while True:
-            user_input = input(f"\n{prompt}\n> ").strip()
+            user_input = _prompt(full_prompt).strip()
             
             if allow_empty or not InputValidator.is_empty(user_input):
                 return user_input
@@ -24,8 +47,10 @@ class UserPrompts:
         else:
             default_text = " [y/n]"
         
+        full_prompt = f"\n{prompt}{default_text}\n> "
+        
         while True:
-            user_input = input(f"\n{prompt}{default_text}\n> ").strip()
+            user_input = _prompt(full_prompt).strip()
             
             if InputValidator.is_empty(user_input) and default is not None:
                 return default
@@ -40,9 +65,11 @@ class UserPrompts:
     @staticmethod
     def get_menu_choice(prompt: str, max_option: int, allow_back: bool = False) -> int:
         back_text = " (or 0 to go back)" if allow_back else ""
+        full_prompt = f"\n{prompt}{back_text}\n> "
+        retry_message = f"Please enter a number between 1 and {max_option}."
         
         while True:
-            user_input = input(f"\n{prompt}{back_text}\n> ").strip()
+            user_input = _prompt(full_prompt).strip()
             
             if allow_back and user_input == "0":
                 return 0
@@ -52,7 +79,7 @@ class UserPrompts:
             if choice is not None:
                 return choice
             
-            print(f"Please enter a number between 1 and {max_option}.")
+            print(retry_message)
     
     @staticmethod
     def get_numeric_input(
@@ -60,16 +87,13 @@ class UserPrompts:
         min_value: Optional[float] = None,
         max_value: Optional[float] = None
     ) -> float:
-        range_text = ""
-        if min_value is not None and max_value is not None:
-            range_text = f" ({min_value} - {max_value})"
-        elif min_value is not None:
-            range_text = f" (minimum: {min_value})"
-        elif max_value is not None:
-            range_text = f" (maximum: {max_value})"
+        range_text = _RANGE_FMT[(min_value is not None, max_value is not None)](min_value, max_value)
+        full_prompt = f"\n{prompt}{range_text}\n> "
+        msg_min = f"Value must be at least {min_value}." if min_value is not None else None
+        msg_max = f"Value must be at most {max_value}." if max_value is not None else None
         
         while True:
-            user_input = input(f"\n{prompt}{range_text}\n> ").strip()
+            user_input = _prompt(full_prompt).strip()
             
             if not InputValidator.is_numeric(user_input):
                 print("Please enter a valid number.")
@@ -78,11 +102,11 @@ class UserPrompts:
             value = float(user_input)
             
             if min_value is not None and value < min_value:
-                print(f"Value must be at least {min_value}.")
+                print(msg_min)
                 continue
             
             if max_value is not None and value > max_value:
-                print(f"Value must be at most {max_value}.")
+                print(msg_max)
                 continue
             
             return value
@@ -93,46 +117,45 @@ class UserPrompts:
         min_value: Optional[int] = None,
         max_value: Optional[int] = None
     ) -> int:
-        range_text = ""
-        if min_value is not None and max_value is not None:
-            range_text = f" ({min_value} - {max_value})"
-        elif min_value is not None:
-            range_text = f" (minimum: {min_value})"
-        elif max_value is not None:
-            range_text = f" (maximum: {max_value})"
+        range_text = _RANGE_FMT[(min_value is not None, max_value is not None)](min_value, max_value)
+        full_prompt = f"\n{prompt}{range_text}\n> "
+        msg_min = f"Value must be at least {min_value}." if min_value is not None else None
+        msg_max = f"Value must be at most {max_value}." if max_value is not None else None
         
         while True:
-            user_input = input(f"\n{prompt}{range_text}\n> ").strip()
+            user_input = _prompt(full_prompt).strip()
             
-            if not InputValidator.is_integer(user_input):
+            try:
+                value = InputValidator.validate_integer_input(user_input)
+            except ValueError:
                 print("Please enter a valid integer.")
                 continue
             
-            value = int(user_input)
-            
             if min_value is not None and value < min_value:
-                print(f"Value must be at least {min_value}.")
+                print(msg_min)
                 continue
             
             if max_value is not None and value > max_value:
-                print(f"Value must be at most {max_value}.")
+                print(msg_max)
                 continue
             
             return value
     
     @staticmethod
     def get_choice_from_list(prompt: str, choices: List[str], allow_cancel: bool = False) -> Optional[str]:
-        print(f"\n{prompt}")
-        for i, choice in enumerate(choices, 1):
-            print(f"{i}. {choice}")
+        lines = [prompt]
+        lines.extend(f"{i}. {choice}" for i, choice in enumerate(choices, 1))
         
         if allow_cancel:
-            print("0. Cancel")
+            lines.append("0. Cancel")
+        
+        sys.stdout.write("\n" + "\n".join(lines) + "\n")
         
         max_option = len(choices)
+        retry_message = f"Please enter a number between 1 and {max_option}."
         
         while True:
-            user_input = input("\n> ").strip()
+            user_input = _prompt("\n> ").strip()
             
             if allow_cancel and user_input == "0":
                 return None
@@ -142,7 +165,7 @@ class UserPrompts:
             if choice_num is not None:
                 return choices[choice_num - 1]
             
-            print(f"Please enter a number between 1 and {max_option}.")
+            print(retry_message)
     
     @staticmethod
     def confirm_action(action: str) -> bool:
@@ -154,25 +177,36 @@ class UserPrompts:
     
     @staticmethod
     def get_conversation_message() -> str:
-        user_input = input("\n👤 You: ").strip()
-        
-        while InputValidator.is_empty(user_input):
+        while True:
+            user_input = _prompt("\n👤 You: ").strip()
+            
+            if user_input:
+                return user_input
+            
             print("Input cannot be empty. Please try again.")
-            user_input = input("\n👤 You: ").strip()
-        
-        return user_input
     
     @staticmethod
     def get_multiline_input(prompt: str, end_marker: str = "END") -> str:
         print(f"\n{prompt}")
         print(f"(Type '{end_marker}' on a new line when finished)\n")
         
+        end_marker_upper = end_marker.upper()
+        first_chars = (end_marker_upper[:1], end_marker_upper[:1].lower())
+        
         lines = []
+        lappend = lines.append
         while True:
             line = input()
-            if line.strip().upper() == end_marker:
+            if not end_marker_upper:
+                if not line.strip():
+                    break
+            elif (
+                line
+                and (line[0] in first_chars or line[0].isspace())
+                and line.strip().upper() == end_marker_upper
+            ):
                 break
-            lines.append(line)
+            lappend(line)
         
         return "\n".join(lines).strip()
 
@@ -1,40 +1,206 @@
+import errno
 import json
+import os
+import re
+import stat
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, Iterable, FrozenSet, Set, Union
+
+try:
+    import orjson
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    _ORJSON_INDENT_OPTIONS = _ORJSON_OPTIONS | orjson.OPT_INDENT_2
+except ImportError:
+    orjson = None
+    _ORJSON_OPTIONS = _ORJSON_INDENT_OPTIONS = 0
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+_ENCODER_INDENT2 = json.JSONEncoder(indent=2, ensure_ascii=False)
+_ENCODER_COMPACT = json.JSONEncoder(ensure_ascii=False)
+
+_LONG_DIGITS_RE = re.compile(rb'\d{19}')
+
+_STREAMING_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+_MKDIR_CACHE: Set[Path] = set()
+
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+_MISSING_WINERRORS = frozenset({21, 123, 1921})
+
+
+def _stat_path(file_path: Path) -> Optional[os.stat_result]:
+    try:
+        return os.stat(file_path)
+    except OSError as e:
+        if e.errno in _MISSING_ERRNOS or getattr(e, 'winerror', None) in _MISSING_WINERRORS:
+            return None
+        raise
+    except ValueError:
+        return None
+
+
+def _is_regular_file(file_path: Path) -> int:
+    st = _stat_path(file_path)
+    if st is None:
+        return 0
+    return 1 if stat.S_ISREG(st.st_mode) else 2
+
+
+def _require_regular_file(file_path: Path, kind: str = "JSON") -> os.stat_result:
+    st = _stat_path(file_path)
+    if st is None:
+        raise FileNotFoundError(f"{kind} file not found: {file_path}")
+    
+    if not stat.S_ISREG(st.st_mode):
+        raise ValueError(f"Path is not a file: {file_path}")
+    
+    return st
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None and not _LONG_DIGITS_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _orjson_dumps(data: Any, option: int) -> Optional[bytes]:
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(data, option=option)
+    except orjson.JSONEncodeError:
+        return None
+
+
+def _ensure_dir(directory: Path) -> None:
+    if directory not in _MKDIR_CACHE:
+        directory.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(directory)
+
+
+def _load_json(file_path: Path) -> Any:
+    try:
+        return _loads(file_path.read_bytes())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON format in {file_path}: {str(e)}")
+    except Exception as e:
+        raise RuntimeError(f"Error reading JSON file {file_path}: {str(e)}")
+
+
+def _check_json_list(file_path: Path, key: Optional[str]) -> None:
+    list_prefix = key if key else ""
+    
+    try:
+        with open(file_path, 'rb') as file:
+            for prefix, event, _ in ijson.parse(file):
+                if prefix == list_prefix:
+                    if event != 'start_array':
+                        raise ValueError(f"Expected a list in JSON file: {file_path}")
+                    return
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON format in {file_path}: {str(e)}")
+    
+    raise KeyError(f"Key '{key}' not found in JSON file: {file_path}")
+
+
+def _iter_json_items(file_path: Path, key: Optional[str]) -> Iterator[Any]:
+    item_prefix = f"{key}.item" if key else "item"
+    
+    try:
+        with open(file_path, 'rb') as file:
+            yield from ijson.items(file, item_prefix, use_float=True)
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON format in {file_path}: {str(e)}")
+
+
+def _iter_jsonl(file_path: Path) -> Iterator[Any]:
+    with open(file_path, 'rb') as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield _loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number} of {file_path}: {str(e)}")
+
+
+def _get_encoder(indent: Optional[int]) -> json.JSONEncoder:
+    if indent == 2:
+        return _ENCODER_INDENT2
+    if indent is None:
+        return _ENCODER_COMPACT
+    return json.JSONEncoder(indent=indent, ensure_ascii=False)
 
 
 class JSONHandler:
     
     @staticmethod
     def read_json(file_path: Path) -> Dict[str, Any]:
-        if not file_path.exists():
-            raise FileNotFoundError(f"JSON file not found: {file_path}")
-        
-        if not file_path.is_file():
-            raise ValueError(f"Path is not a file: {file_path}")
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                return data
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format in {file_path}: {str(e)}")
-        except Exception as e:
-            raise RuntimeError(f"Error reading JSON file {file_path}: {str(e)}")
+        _require_regular_file(file_path)
+        return _load_json(file_path)
     
     @staticmethod
     def write_json(file_path: Path, data: Dict[str, Any], indent: int = 2) -> None:
+        target = Path(os.path.realpath(file_path))
+        parent = target.parent
+        tmp_name = None
+        
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(parent)
+            
+            payload = _orjson_dumps(data, _ORJSON_INDENT_OPTIONS) if indent == 2 else None
+            if payload is None:
+                payload = _get_encoder(indent).encode(data).encode('utf-8')
+            
+            tmp_prefix = f"{target.name}."
+            try:
+                fd, tmp_name = tempfile.mkstemp(suffix='.tmp', prefix=tmp_prefix, dir=parent)
+            except FileNotFoundError:
+                parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(suffix='.tmp', prefix=tmp_prefix, dir=parent)
             
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=indent, ensure_ascii=False)
+            with os.fdopen(fd, 'wb', buffering=1 << 20) as file:
+                file.write(payload)
+            
+            st = _stat_path(target)
+            mode = stat.S_IMODE(st.st_mode) if st is not None else 0o666 & ~_UMASK
+            os.chmod(tmp_name, mode)
+            
+            os.replace(tmp_name, target)
         except Exception as e:
+            _MKDIR_CACHE.discard(parent)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
             raise RuntimeError(f"Error writing JSON file {file_path}: {str(e)}")
     
     @staticmethod
     def read_json_list(file_path: Path, key: Optional[str] = None) -> List[Dict[str, Any]]:
-        data = JSONHandler.read_json(file_path)
+        st = _require_regular_file(file_path)
+        
+        if ijson is not None and st.st_size > _STREAMING_THRESHOLD_BYTES:
+            _check_json_list(file_path, key)
+            return list(_iter_json_items(file_path, key))
+        
+        data = _load_json(file_path)
         
         if key:
             if key not in data:
@@ -48,6 +214,15 @@ class JSONHandler:
         
         return items
     
+    @staticmethod
+    def iter_json_list(file_path: Path, key: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        if ijson is None:
+            return iter(JSONHandler.read_json_list(file_path, key))
+        
+        _require_regular_file(file_path)
+        _check_json_list(file_path, key)
+        return _iter_json_items(file_path, key)
+    
     @staticmethod
     def append_to_json_list(file_path: Path, new_item: Dict[str, Any], key: Optional[str] = None) -> None:
         if file_path.exists():
@@ -69,11 +244,47 @@ class JSONHandler:
         JSONHandler.write_json(file_path, data)
     
     @staticmethod
-    def validate_json_structure(data: Dict[str, Any], required_keys: List[str]) -> bool:
+    def append_jsonl(file_path: Path, item: Dict[str, Any]) -> None:
+        parent = file_path.parent
+        
+        try:
+            _ensure_dir(parent)
+            
+            line = _orjson_dumps(item, _ORJSON_OPTIONS)
+            if line is None:
+                line = _ENCODER_COMPACT.encode(item).encode('utf-8')
+            
+            try:
+                file = open(file_path, 'ab')
+            except FileNotFoundError:
+                parent.mkdir(parents=True, exist_ok=True)
+                file = open(file_path, 'ab')
+            
+            with file:
+                file.write(line + b'\n')
+        except Exception as e:
+            _MKDIR_CACHE.discard(parent)
+            raise RuntimeError(f"Error appending to JSONL file {file_path}: {str(e)}")
+    
+    @staticmethod
+    def read_jsonl(file_path: Path) -> Iterator[Dict[str, Any]]:
+        _require_regular_file(file_path, "JSONL")
+        return _iter_jsonl(file_path)
+    
+    @staticmethod
+    def make_schema(keys: Iterable[str]) -> FrozenSet[str]:
+        return frozenset(keys)
+    
+    @staticmethod
+    def validate_json_structure(
+        data: Dict[str, Any],
+        required_keys: Union[List[str], FrozenSet[str]]
+    ) -> bool:
         if not isinstance(data, dict):
             raise ValueError("Data must be a dictionary")
         
-        missing_keys = [key for key in required_keys if key not in data]
+        data_keys = data.keys()
+        missing_keys = [key for key in required_keys if key not in data_keys]
         if missing_keys:
             raise ValueError(f"Missing required keys: {', '.join(missing_keys)}")
         
@@ -85,4 +296,4 @@ class JSONHandler:
     
     @staticmethod
     def file_exists(file_path: Path) -> bool:
-        return file_path.exists() and file_path.is_file()
+        return _is_regular_file(file_path) == 1
@@ -1,8 +1,43 @@
 import re
-from typing import Optional, List
+from typing import Optional, List, FrozenSet
 from decimal import Decimal, InvalidOperation
 
 
+_ALNUM_RE = re.compile(r'^[a-zA-Z0-9]+$')
+_ALNUM_SPACE_RE = re.compile(r'^[a-zA-Z0-9\s]+$')
+
+_PRICE_RE = re.compile(r'^\+?(\d+(\.\d*)?|\.\d+)$')
+
+_YES = frozenset({'y', 'yes', 'yeah', 'yep', 'sure', 'ok', 'okay'})
+_NO = frozenset({'n', 'no', 'nope', 'nah'})
+
+
+def _try_float(value: str) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return float(value.strip())
+    except ValueError:
+        return None
+
+
+def _is_int_literal(cleaned: str) -> bool:
+    digits = cleaned[1:] if cleaned[:1] in ('+', '-') else cleaned
+    return digits.isdecimal()
+
+
+def _try_int(value: str) -> Optional[int]:
+    if not value:
+        return None
+    cleaned = value.strip()
+    if not _is_int_literal(cleaned):
+        return None
+    try:
+        return int(cleaned)
+    except ValueError:
+        return None
+
+
 class InputValidator:
     
     @staticmethod
@@ -11,10 +46,10 @@ class InputValidator:
     
     @staticmethod
     def is_valid_length(value: str, min_length: int = 1, max_length: Optional[int] = None) -> bool:
-        if InputValidator.is_empty(value):
+        if not value:
             return False
         length = len(value.strip())
-        if length < min_length:
+        if not length or length < min_length:
             return False
         if max_length is not None and length > max_length:
             return False
@@ -22,81 +57,75 @@ class InputValidator:
     
     @staticmethod
     def is_numeric(value: str) -> bool:
-        if InputValidator.is_empty(value):
-            return False
-        try:
-            float(value.strip())
-            return True
-        except ValueError:
-            return False
+        return _try_float(value) is not None
     
     @staticmethod
     def is_integer(value: str) -> bool:
-        if InputValidator.is_empty(value):
-            return False
-        try:
-            int(value.strip())
-            return True
-        except ValueError:
-            return False
+        return _try_int(value) is not None
     
     @staticmethod
     def is_positive_number(value: str) -> bool:
-        if not InputValidator.is_numeric(value):
-            return False
-        return float(value.strip()) > 0
+        num = _try_float(value)
+        return num is not None and num > 0
     
     @staticmethod
     def is_in_range(value: str, min_value: float, max_value: float) -> bool:
-        if not InputValidator.is_numeric(value):
-            return False
-        num = float(value.strip())
-        return min_value <= num <= max_value
+        num = _try_float(value)
+        return num is not None and min_value <= num <= max_value
     
     @staticmethod
-    def is_valid_choice(value: str, valid_choices: List[str], case_sensitive: bool = False) -> bool:
+    def is_valid_choice(
+        value: str,
+        valid_choices: List[str],
+        case_sensitive: bool = False,
+        lowered_choices: Optional[FrozenSet[str]] = None
+    ) -> bool:
         if InputValidator.is_empty(value):
             return False
         cleaned_value = value.strip()
         if case_sensitive:
             return cleaned_value in valid_choices
-        return cleaned_value.lower() in [choice.lower() for choice in valid_choices]
+        if lowered_choices is None:
+            lowered_choices = frozenset(map(str.lower, valid_choices))
+        return cleaned_value.lower() in lowered_choices
     
     @staticmethod
     def sanitize_input(value: str) -> str:
-        if InputValidator.is_empty(value):
-            return ""
-        return value.strip()
+        return value.strip() if value else ""
     
     @staticmethod
     def validate_yes_no(value: str) -> Optional[bool]:
-        if InputValidator.is_empty(value):
+        cleaned = value.strip() if value else ""
+        if not cleaned:
             return None
-        cleaned = value.strip().lower()
-        if cleaned in ['y', 'yes', 'yeah', 'yep', 'sure', 'ok', 'okay']:
+        first = cleaned[0]
+        if first in ('y', 'Y'):
+            return True
+        if first in ('n', 'N'):
+            return False
+        cleaned = cleaned.lower()
+        if cleaned in _YES:
             return True
-        if cleaned in ['n', 'no', 'nope', 'nah']:
+        if cleaned in _NO:
             return False
         return None
     
     @staticmethod
     def validate_menu_choice(value: str, max_option: int) -> Optional[int]:
-        if not InputValidator.is_integer(value):
+        choice = _try_int(value)
+        if choice is None:
             return None
-        choice = int(value.strip())
         if 1 <= choice <= max_option:
             return choice
         return None
     
     @staticmethod
     def validate_price(value: str) -> Optional[Decimal]:
-        if InputValidator.is_empty(value):
+        cleaned = value.strip() if value else ""
+        if not cleaned or not _PRICE_RE.match(cleaned):
             return None
         try:
-            price = Decimal(value.strip())
-            if price < 0:
-                return None
-            return price
+            return Decimal(cleaned)
         except InvalidOperation:
             return None
     
@@ -104,33 +133,37 @@ class InputValidator:
     def contains_only_alphanumeric(value: str, allow_spaces: bool = False) -> bool:
         if InputValidator.is_empty(value):
             return False
-        pattern = r'^[a-zA-Z0-9\s]+$' if allow_spaces else r'^[a-zA-Z0-9]+$'
-        return bool(re.match(pattern, value.strip()))
+        pattern = _ALNUM_SPACE_RE if allow_spaces else _ALNUM_RE
+        return bool(pattern.match(value.strip()))
     
     @staticmethod
     def validate_non_empty(value: str, field_name: str = "Input") -> str:
-        if InputValidator.is_empty(value):
+        cleaned = value.strip() if value else ""
+        if not cleaned:
             raise ValueError(f"{field_name} cannot be empty")
-        return value.strip()
+        return cleaned
     
     @staticmethod
     def validate_length(value: str, min_length: int, max_length: int, field_name: str = "Input") -> str:
         cleaned = InputValidator.validate_non_empty(value, field_name)
-        if not InputValidator.is_valid_length(cleaned, min_length, max_length):
+        length = len(cleaned)
+        if length < min_length or (max_length is not None and length > max_length):
             raise ValueError(f"{field_name} must be between {min_length} and {max_length} characters")
         return cleaned
     
     @staticmethod
     def validate_numeric_input(value: str, field_name: str = "Input") -> float:
-        if not InputValidator.is_numeric(value):
+        num = _try_float(value)
+        if num is None:
             raise ValueError(f"{field_name} must be a valid number")
-        return float(value.strip())
+        return num
     
     @staticmethod
     def validate_integer_input(value: str, field_name: str = "Input") -> int:
-        if not InputValidator.is_integer(value):
+        num = _try_int(value)
+        if num is None:
             raise ValueError(f"{field_name} must be a valid integer")
-        return int(value.strip())
+        return num
     
     @staticmethod
     def validate_range_input(value: str, min_value: float, max_value: float, field_name: str = "Input") -> float: